@@ -13,6 +13,9 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Parsed once and shared by every test (tests treat it as read-only)
+_CONFIG = json.loads((Path(__file__).parent.parent / "config" / "config.json").read_text())
+
 def test_cue_manager():
     """Test CueManager functionality."""
     print("\n🎯 Testing CueManager...")
@@ -21,9 +24,7 @@ def test_cue_manager():
         from core.cue_manager import CueManager, CuePoint, CueType
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         manager = CueManager(config)
         print("✅ CueManager created successfully")
@@ -95,9 +96,7 @@ def test_metadata_parser():
         from core.metadata_parser import MetadataParser, TrackMetadata
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         # Check if mutagen is available
         try:
@@ -173,9 +172,7 @@ def test_serato_bridge():
         from core.cue_manager import CuePoint, CueType
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         bridge = SeratoBridge(config)
         print("✅ SeratoBridge created successfully")
@@ -229,20 +226,17 @@ def test_enhanced_sidebar():
     
     try:
         from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import Qt
         from gui.sidebar import Sidebar, CuePointWidget
         from core.cue_manager import CueManager, CuePoint
         
         # Create QApplication
+        # Qt 6 always enables high-DPI scaling; AA_EnableHighDpiScaling is gone
         app = QApplication.instance()
         if app is None:
             app = QApplication([])
-            app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         # Create sidebar
         sidebar = Sidebar(config)
@@ -293,19 +287,16 @@ def test_main_window_integration():
     
     try:
         from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import Qt
         from gui.main_window import MainWindow
         
         # Create QApplication
+        # Qt 6 always enables high-DPI scaling; AA_EnableHighDpiScaling is gone
         app = QApplication.instance()
         if app is None:
             app = QApplication([])
-            app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         # Create MainWindow
         window = MainWindow(config)
@@ -324,6 +315,17 @@ def test_main_window_integration():
         # Test cue point setting (without actual audio)
         # This would normally require loaded audio
         try:
+            # The no-audio path pops a modal "No Audio" QMessageBox, which
+            # would block a headless run - auto-dismiss it from a timer
+            # that fires inside the dialog's event loop
+            from PyQt6.QtCore import QTimer
+
+            def _dismiss_modal():
+                modal = QApplication.activeModalWidget()
+                if modal is not None:
+                    modal.close()
+
+            QTimer.singleShot(100, _dismiss_modal)
             window._set_cue_point(1)  # Should show "No Audio" message
             print("✅ Cue point setting method working")
         except Exception:
@@ -352,9 +354,7 @@ def test_phase2_workflow():
         from core.serato_bridge import SeratoBridge
         
         # Load config
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _CONFIG
         
         # Create components
         cue_manager = CueManager(config)
@@ -6,21 +6,22 @@ Setup script for macOS distribution
 
 import os
 import sys
-from setuptools import setup, find_packages
+from setuptools import setup
 
-# Read version from config
+# Static package list - find_packages() walked the whole src tree on every
+# build; keep in sync with [tool.setuptools] in pyproject.toml
+PACKAGES = ["analysis", "core", "gui", "playback"]
+
+# Read version from config (dependencies live in pyproject.toml - PEP 621 -
+# so pip parses them once via tomllib instead of this script re-reading
+# requirements.txt on every build)
 import json
-with open('config/config.json', 'r') as f:
-    config = json.load(f)
-    VERSION = config['app']['version']
+from pathlib import Path
 
-# Read requirements
-with open('requirements.txt', 'r') as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+VERSION = json.loads(Path('config/config.json').read_text())['app']['version']
 
 # Read README for long description
-with open('README.md', 'r', encoding='utf-8') as f:
-    long_description = f.read()
+long_description = Path('README.md').read_text(encoding='utf-8')
 
 setup(
     name="cuepoint",
@@ -31,7 +32,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/cuepoint/cuepoint",
-    packages=find_packages(where="src"),
+    packages=PACKAGES,
     package_dir={"": "src"},
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -45,21 +46,6 @@ setup(
         "Topic :: Multimedia :: Sound/Audio :: Analysis",
     ],
     python_requires=">=3.11",
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest>=7.4.0",
-            "pytest-qt>=4.2.0", 
-            "pytest-cov>=4.1.0",
-            "black>=23.7.0",
-            "ruff>=0.0.287",
-            "mypy>=1.5.0",
-        ],
-        "profiling": [
-            "memory-profiler>=0.61.0",
-            "line-profiler>=4.1.0",
-        ]
-    },
     entry_points={
         "console_scripts": [
             "cuepoint=cuepoint.main:main",
@@ -28,8 +28,61 @@ except ImportError:
     SCIPY_AVAILABLE = False
     logging.warning("scipy not available - advanced analysis disabled")
 
-from ..core.audio_loader import AudioData
-from ..core.beatgrid_engine import BeatgridData
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import torch
+    import torchaudio
+    TORCHAUDIO_AVAILABLE = True
+except ImportError:
+    TORCHAUDIO_AVAILABLE = False
+
+from core.audio_loader import AudioData
+from core.beatgrid_engine import BeatgridData
+
+
+def _peak_spacing_stability(autocorr: np.ndarray, threshold: float) -> float:
+    """Stability (1 - std/mean) of spacings between autocorrelation peaks.
+
+    Single-pass local-maxima pick plus streaming spacing statistics;
+    JIT-compiled when numba is available. Returns -1.0 when fewer than
+    two peaks clear the threshold, so callers can fall back.
+    """
+    last_peak = -1
+    total = 0.0
+    total_sq = 0.0
+    n_spacings = 0
+
+    for i in range(1, autocorr.shape[0] - 1):
+        value = autocorr[i]
+        if value > autocorr[i - 1] and value > autocorr[i + 1] and value > threshold:
+            if last_peak >= 0:
+                spacing = i - last_peak
+                total += spacing
+                total_sq += spacing * spacing
+                n_spacings += 1
+            last_peak = i
+
+    if n_spacings < 1:
+        return -1.0
+
+    mean = total / n_spacings
+    variance = total_sq / n_spacings - mean * mean
+    if variance < 0.0:
+        variance = 0.0
+
+    stability = 1.0 - (variance ** 0.5) / (mean + 1e-8)
+    return max(0.0, min(1.0, stability))
+
+
+# No cache=True: the module is imported both as analysis.* and
+# src.analysis.*, and numba's on-disk cache is keyed by module path
+if NUMBA_AVAILABLE:
+    _peak_spacing_stability = njit(fastmath=True)(_peak_spacing_stability)
 
 
 class StructureType(Enum):
@@ -45,7 +98,22 @@ class StructureType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Default display colors per structure type - built once at import instead
+# of per StructureSection instance
+_DEFAULT_COLORS = {
+    StructureType.INTRO: "#4A90E2",     # Blue
+    StructureType.VERSE: "#7ED321",     # Green
+    StructureType.CHORUS: "#F5A623",    # Orange
+    StructureType.BRIDGE: "#9013FE",    # Purple
+    StructureType.BREAKDOWN: "#50E3C2", # Cyan
+    StructureType.BUILDUP: "#BD10E0",   # Magenta
+    StructureType.DROP: "#FF3366",      # Red
+    StructureType.OUTRO: "#B8E986",     # Light Green
+    StructureType.UNKNOWN: "#888888"    # Gray
+}
+
+
+@dataclass(slots=True)
 class StructureSection:
     """Individual structure section with timing and characteristics."""
     type: StructureType
@@ -68,18 +136,7 @@ class StructureSection:
     
     def _get_default_color(self) -> str:
         """Get default color for structure type."""
-        color_map = {
-            StructureType.INTRO: "#4A90E2",     # Blue
-            StructureType.VERSE: "#7ED321",     # Green
-            StructureType.CHORUS: "#F5A623",    # Orange
-            StructureType.BRIDGE: "#9013FE",    # Purple
-            StructureType.BREAKDOWN: "#50E3C2", # Cyan
-            StructureType.BUILDUP: "#BD10E0",   # Magenta
-            StructureType.DROP: "#FF3366",      # Red
-            StructureType.OUTRO: "#B8E986",     # Light Green
-            StructureType.UNKNOWN: "#888888"    # Gray
-        }
-        return color_map.get(self.type, "#888888")
+        return _DEFAULT_COLORS.get(self.type, "#888888")
     
     @property
     def duration(self) -> float:
@@ -124,17 +181,59 @@ class StructureAnalysisResult:
     analysis_time: float = 0.0
     algorithm_used: str = "librosa_segmentation"
     features_used: List[str] = field(default_factory=list)
-    
+    _starts: Optional[np.ndarray] = field(init=False, default=None,
+                                          repr=False, compare=False)
+
     def get_section_at_time(self, time_seconds: float) -> Optional[StructureSection]:
-        """Get the structure section at a specific time."""
-        for section in self.sections:
-            if section.start_time <= time_seconds <= section.end_time:
-                return section
+        """Get the structure section at a specific time.
+
+        O(log N) over a lazily built start-time index - this is queried per
+        playback tick from the UI. The index rebuilds if sections changed
+        length; callers mutating sections in place should reset _starts.
+        """
+        if not self.sections:
+            return None
+
+        if self._starts is None or len(self._starts) != len(self.sections):
+            self._starts = np.fromiter((s.start_time for s in self.sections),
+                                       dtype=np.float64, count=len(self.sections))
+
+        # First section whose start is >= t; the neighbour to the left is
+        # checked first so shared boundaries resolve to the earlier section,
+        # matching the original scan order
+        index = int(np.searchsorted(self._starts, time_seconds, side='left'))
+
+        if index > 0:
+            candidate = self.sections[index - 1]
+            if candidate.start_time <= time_seconds <= candidate.end_time:
+                return candidate
+
+        if index < len(self.sections):
+            candidate = self.sections[index]
+            if candidate.start_time <= time_seconds <= candidate.end_time:
+                return candidate
+
         return None
     
     def get_sections_by_type(self, section_type: StructureType) -> List[StructureSection]:
         """Get all sections of a specific type."""
         return [s for s in self.sections if s.type == section_type]
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Structure-of-arrays view of section fields for vectorized passes."""
+        count = len(self.sections)
+        return {
+            'start_time': np.fromiter((s.start_time for s in self.sections),
+                                      dtype=np.float64, count=count),
+            'end_time': np.fromiter((s.end_time for s in self.sections),
+                                    dtype=np.float64, count=count),
+            'confidence': np.fromiter((s.confidence for s in self.sections),
+                                      dtype=np.float32, count=count),
+            'energy_level': np.fromiter((s.energy_level for s in self.sections),
+                                        dtype=np.float32, count=count),
+            'spectral_centroid': np.fromiter((s.spectral_centroid for s in self.sections),
+                                             dtype=np.float32, count=count),
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -152,6 +251,31 @@ class StructureAnalysisError(Exception):
     pass
 
 
+def _analyze_track_worker(payload: Tuple[bytes, int, int, float, Dict[str, Any]]) -> 'StructureAnalysisResult':
+    """Analyze one track in a worker process.
+
+    Free function taking primitives so only raw audio bytes and config
+    travel across the process boundary, not analyzer state.
+    """
+    audio_bytes, channels, sample_rate, duration, config = payload
+
+    data = np.frombuffer(audio_bytes, dtype=np.float32).reshape(channels, -1)
+    audio_data = AudioData(
+        data=data,
+        sample_rate=sample_rate,
+        duration=duration,
+        channels=channels,
+        file_path=Path("<batch>"),
+        format="raw",
+        bit_depth=32,
+        file_size=data.nbytes,
+        load_time=0.0
+    )
+
+    analyzer = StructureAnalyzer(config)
+    return analyzer.analyze_structure(audio_data)
+
+
 class StructureAnalyzer:
     """
     Advanced structure analyzer for automatic detection of musical sections.
@@ -172,7 +296,32 @@ class StructureAnalyzer:
         self.hop_length = config.get('structure', {}).get('hop_length', 512)
         self.frame_length = config.get('structure', {}).get('frame_length', 2048)
         self.n_mels = config.get('structure', {}).get('n_mels', 128)
+
+        # Structural boundaries live at second-scale resolution, so analysis
+        # runs at a reduced rate - halves every FFT and memory pass
+        self.target_sample_rate = config.get('structure', {}).get('target_sample_rate', 22050)
+
+        # Boundary detector: 'agglomerative' (default) builds a dense O(N^2)
+        # similarity matrix; 'laplacian' clusters a sparse recurrence graph,
+        # which stays near-linear in memory on long tracks
+        self.boundary_algorithm = config.get('structure', {}).get('boundary_algorithm', 'agglomerative')
         
+        # Optional GPU feature backend (opt-in): the spectral transforms all
+        # have torchaudio CUDA implementations; chroma/contrast stay on CPU
+        self.use_gpu = (
+            TORCHAUDIO_AVAILABLE
+            and config.get('structure', {}).get('backend', 'librosa') == 'torchaudio_cuda'
+            and torch.cuda.is_available()
+        )
+        self._gpu_transforms: Optional[Dict[str, Any]] = None
+
+        # On-disk feature cache - features are deterministic for a given
+        # (audio content, analysis parameters) pair
+        self.cache_features = config.get('structure', {}).get('cache_features', True)
+        self.cache_dir = Path(
+            config.get('structure', {}).get('cache_dir', '~/.cache/cuepoint/features')
+        ).expanduser()
+
         # Feature weights for classification
         self.feature_weights = config.get('structure', {}).get('feature_weights', {
             'energy': 0.3,
@@ -212,29 +361,53 @@ class StructureAnalyzer:
         start_time = time.time()
         
         try:
-            # Use mono audio for analysis
+            # Use mono audio for analysis - float32 end to end halves the
+            # bandwidth of every downstream transform
             if audio_data.channels > 1:
-                mono_audio = np.mean(audio_data.data, axis=0)
+                mono_audio = np.mean(audio_data.data, axis=0, dtype=np.float32)
             else:
-                mono_audio = audio_data.data[0]
-            
-            # Extract audio features
-            features = self._extract_features(mono_audio, audio_data.sample_rate)
-            
+                mono_audio = np.ascontiguousarray(audio_data.data[0], dtype=np.float32)
+
+            # Downsample before feature extraction (polyphase is cheap)
+            sample_rate = audio_data.sample_rate
+            if sample_rate > self.target_sample_rate:
+                mono_audio = librosa.resample(
+                    mono_audio, orig_sr=sample_rate,
+                    target_sr=self.target_sample_rate, res_type='polyphase'
+                )
+                sample_rate = self.target_sample_rate
+
+            # Extract audio features (or reuse the cached extraction)
+            features = None
+            cache_path = None
+            if self.cache_features:
+                cache_path = self._feature_cache_path(mono_audio)
+                features = self._load_cached_features(cache_path)
+
+            if features is None:
+                features = self._extract_features(mono_audio, sample_rate)
+                if cache_path is not None:
+                    self._save_cached_features(cache_path, features)
+
             # Detect segment boundaries
-            boundaries = self._detect_boundaries(features, audio_data.sample_rate)
-            
+            boundaries = self._detect_boundaries(features, sample_rate)
+
             # Classify segments
             sections = self._classify_segments(
-                boundaries, features, mono_audio, 
-                audio_data.sample_rate, beatgrid_data
+                boundaries, features, mono_audio,
+                sample_rate, beatgrid_data
             )
             
             # Post-process and validate sections
             sections = self._post_process_sections(sections, audio_data.duration)
             
-            # Calculate overall confidence
-            overall_confidence = np.mean([s.confidence for s in sections]) if sections else 0.0
+            # Calculate overall confidence (fromiter skips the list detour)
+            if sections:
+                confidences = np.fromiter((s.confidence for s in sections),
+                                          dtype=np.float32, count=len(sections))
+                overall_confidence = float(confidences.mean())
+            else:
+                overall_confidence = 0.0
             
             analysis_time = time.time() - start_time
             
@@ -255,13 +428,159 @@ class StructureAnalyzer:
             self.logger.error(f"Structure analysis failed: {e}")
             raise StructureAnalysisError(f"Analysis failed: {e}")
     
+    def analyze_structure_batch(self, tracks: List[AudioData]) -> List['StructureAnalysisResult']:
+        """Analyze several tracks across a process pool.
+
+        Feature extraction dominates and is independent per track, so
+        throughput scales roughly with core count on batch workflows.
+        """
+        if not tracks:
+            return []
+
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        payloads = [
+            (np.ascontiguousarray(np.atleast_2d(track.data), dtype=np.float32).tobytes(),
+             int(np.atleast_2d(track.data).shape[0]),
+             track.sample_rate,
+             track.duration,
+             self.config)
+            for track in tracks
+        ]
+
+        max_workers = min(len(payloads), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_analyze_track_worker, payloads))
+
+    def _feature_cache_path(self, mono_audio: np.ndarray) -> Path:
+        """Cache file path keyed on audio content and analysis parameters."""
+        import hashlib
+
+        digest = hashlib.blake2b(mono_audio.tobytes(), digest_size=16).hexdigest()
+
+        # Weight gating decides which features get extracted, so it is part
+        # of the cache identity
+        gates = ''.join(
+            '1' if self.feature_weights.get(name, 0) > 0 else '0'
+            for name in ('chroma', 'spectral_contrast')
+        )
+        key = f"{digest}_{self.hop_length}_{self.frame_length}_{self.n_mels}_{gates}"
+        return self.cache_dir / f"{key}.npz"
+
+    def _load_cached_features(self, cache_path: Path) -> Optional[Dict[str, np.ndarray]]:
+        """Load cached features, or None when absent/unreadable."""
+        if not cache_path.exists():
+            return None
+
+        try:
+            with np.load(cache_path) as archive:
+                features = {name: archive[name] for name in archive.files}
+            self.logger.debug(f"Loaded cached features: {cache_path.name}")
+            return features
+        except Exception as e:
+            self.logger.warning(f"Failed to load feature cache: {e}")
+            return None
+
+    def _save_cached_features(self, cache_path: Path,
+                              features: Dict[str, np.ndarray]) -> None:
+        """Persist extracted features (float32 halves the disk footprint)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            np.savez_compressed(cache_path, **{
+                name: np.asarray(value, dtype=np.float32)
+                for name, value in features.items()
+            })
+        except Exception as e:
+            self.logger.warning(f"Failed to write feature cache: {e}")
+
+    def _build_gpu_transforms(self, sample_rate: int) -> Dict[str, Any]:
+        """Create (and cache) torchaudio CUDA transforms - they precompute
+        filter banks, so construction is amortized across tracks."""
+        if self._gpu_transforms is None or self._gpu_transforms['sample_rate'] != sample_rate:
+            mel_kwargs = {
+                'n_fft': self.frame_length,
+                'hop_length': self.hop_length,
+                'n_mels': self.n_mels,
+            }
+            self._gpu_transforms = {
+                'sample_rate': sample_rate,
+                'spectrogram': torchaudio.transforms.Spectrogram(
+                    n_fft=self.frame_length, hop_length=self.hop_length, power=1.0
+                ).cuda(),
+                'mel': torchaudio.transforms.MelSpectrogram(
+                    sample_rate=sample_rate, **mel_kwargs
+                ).cuda(),
+                'mfcc': torchaudio.transforms.MFCC(
+                    sample_rate=sample_rate, n_mfcc=13, melkwargs=mel_kwargs
+                ).cuda(),
+            }
+        return self._gpu_transforms
+
+    def _extract_features_gpu(self, audio: np.ndarray, sample_rate: int) -> Dict[str, np.ndarray]:
+        """Extract features with torchaudio on CUDA.
+
+        The audio transfers to the GPU once; chroma and spectral contrast
+        have no torchaudio equivalent and run on the returned magnitude.
+        """
+        transforms = self._build_gpu_transforms(sample_rate)
+        tensor = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32)).cuda()
+
+        magnitude_t = transforms['spectrogram'](tensor)
+        mel_db_t = torchaudio.functional.amplitude_to_DB(
+            transforms['mel'](tensor), multiplier=10.0, amin=1e-10, db_multiplier=0.0
+        )
+
+        # RMS energy and spectral centroid directly from the magnitude
+        energy_t = torch.sqrt(torch.mean(magnitude_t ** 2, dim=0))
+        freqs = torch.linspace(0, sample_rate / 2, magnitude_t.shape[0], device=tensor.device)
+        centroid_t = (freqs[:, None] * magnitude_t).sum(dim=0) / (magnitude_t.sum(dim=0) + 1e-10)
+
+        # Onset strength as rectified spectral flux over the mel bands
+        flux = torch.clamp(mel_db_t[:, 1:] - mel_db_t[:, :-1], min=0.0).mean(dim=0)
+        onset_t = torch.nn.functional.pad(flux, (1, 0))
+
+        magnitude = magnitude_t.cpu().numpy()
+
+        features = {
+            'energy': energy_t.cpu().numpy(),
+            'spectral_centroid': centroid_t.cpu().numpy(),
+            'mfcc': transforms['mfcc'](tensor).cpu().numpy(),
+            'zcr': librosa.feature.zero_crossing_rate(
+                audio, hop_length=self.hop_length
+            )[0],
+            'onset_strength': onset_t.cpu().numpy(),
+        }
+
+        if self.feature_weights.get('chroma', 0) > 0:
+            features['chroma'] = librosa.feature.chroma_stft(
+                S=magnitude, sr=sample_rate, hop_length=self.hop_length
+            )
+        if self.feature_weights.get('spectral_contrast', 0) > 0:
+            features['spectral_contrast'] = librosa.feature.spectral_contrast(
+                S=magnitude, sr=sample_rate, hop_length=self.hop_length
+            )
+
+        return features
+
     def _extract_features(self, audio: np.ndarray, sample_rate: int) -> Dict[str, np.ndarray]:
         """Extract audio features for structure analysis."""
+        if self.use_gpu:
+            try:
+                return self._extract_features_gpu(audio, sample_rate)
+            except Exception as e:
+                self.logger.warning(f"GPU feature extraction failed, using CPU: {e}")
+
         features = {}
-        
+
         try:
-            # Spectral features
-            stft = librosa.stft(audio, hop_length=self.hop_length, n_fft=self.frame_length)
+            # Spectral features. center=False skips the reflection-padding
+            # copy of the whole track and complex64 halves STFT memory; all
+            # frame->time mappings below use the same left-edge convention,
+            # so boundaries stay self-consistent (uniform n_fft/2 offset)
+            stft = librosa.stft(audio, hop_length=self.hop_length,
+                                n_fft=self.frame_length, center=False,
+                                dtype=np.complex64)
             magnitude = np.abs(stft)
             
             # Energy (RMS)
@@ -274,30 +593,39 @@ class StructureAnalyzer:
                 S=magnitude, sr=sample_rate, hop_length=self.hop_length
             )[0]
             
-            # MFCCs
-            features['mfcc'] = librosa.feature.mfcc(
-                y=audio, sr=sample_rate, n_mfcc=13, 
-                hop_length=self.hop_length
-            )
-            
-            # Chroma features
-            features['chroma'] = librosa.feature.chroma_stft(
-                S=magnitude, sr=sample_rate, hop_length=self.hop_length
-            )
-            
-            # Spectral contrast
-            features['spectral_contrast'] = librosa.feature.spectral_contrast(
-                S=magnitude, sr=sample_rate, hop_length=self.hop_length
+            # Mel power spectrogram derived from the same STFT - feeding it
+            # to MFCC and onset strength avoids two redundant STFT passes
+            # plus an extra mel-filterbank multiply
+            mel = librosa.feature.melspectrogram(
+                S=magnitude**2, sr=sample_rate,
+                n_mels=self.n_mels, hop_length=self.hop_length
             )
-            
+            mel_db = librosa.power_to_db(mel)
+
+            # MFCCs
+            features['mfcc'] = librosa.feature.mfcc(S=mel_db, n_mfcc=13)
+
+            # Chroma features (skipped when weighted out of classification)
+            if self.feature_weights.get('chroma', 0) > 0:
+                features['chroma'] = librosa.feature.chroma_stft(
+                    S=magnitude, sr=sample_rate, hop_length=self.hop_length
+                )
+
+            # Spectral contrast is comparatively expensive and carries no
+            # weight in the default classifier - only compute on request
+            if self.feature_weights.get('spectral_contrast', 0) > 0:
+                features['spectral_contrast'] = librosa.feature.spectral_contrast(
+                    S=magnitude, sr=sample_rate, hop_length=self.hop_length
+                )
+
             # Zero crossing rate
             features['zcr'] = librosa.feature.zero_crossing_rate(
                 audio, hop_length=self.hop_length
             )[0]
-            
+
             # Tempo features
             onset_envelope = librosa.onset.onset_strength(
-                y=audio, sr=sample_rate, hop_length=self.hop_length
+                S=mel_db, sr=sample_rate, hop_length=self.hop_length
             )
             features['onset_strength'] = onset_envelope
             
@@ -315,61 +643,97 @@ class StructureAnalyzer:
         try:
             # Combine features for boundary detection
             feature_matrix = self._combine_features_for_segmentation(features)
-            
-            # Use librosa's segment boundaries detection
-            boundaries = librosa.segment.agglomerative(
-                feature_matrix, 
-                k=None,  # Let algorithm determine number of segments
-                clusterer=None
-            )
-            
+
+            duration = len(features['energy']) * self.hop_length / sample_rate
+
+            # Use librosa's segment boundaries detection (the clusterer
+            # requires an explicit segment count - scale with duration)
+            n_segments = max(2, min(self.max_sections, int(duration / 30) + 2))
+
+            if self.boundary_algorithm == 'laplacian':
+                boundaries = self._laplacian_boundaries(feature_matrix, n_segments)
+            else:
+                boundaries = librosa.segment.agglomerative(feature_matrix, n_segments)
+
             # Convert frame indices to time
             boundary_times = librosa.frames_to_time(
                 boundaries, sr=sample_rate, hop_length=self.hop_length
             )
-            
-            # Ensure we have start and end boundaries
-            if boundary_times[0] > 0:
-                boundary_times = np.insert(boundary_times, 0, 0.0)
-            
-            duration = len(features['energy']) * self.hop_length / sample_rate
-            if boundary_times[-1] < duration:
-                boundary_times = np.append(boundary_times, duration)
-            
+
+            # Ensure start/end boundaries without the insert/append copies:
+            # one preallocated array, deduped and sorted by unique
+            full_boundaries = np.empty(len(boundary_times) + 2, dtype=boundary_times.dtype)
+            full_boundaries[0] = 0.0
+            full_boundaries[1:-1] = boundary_times
+            full_boundaries[-1] = duration
+            boundary_times = np.unique(full_boundaries)
+
             self.logger.debug(f"Detected {len(boundary_times)} boundaries")
-            
+
             return boundary_times
-            
+
         except Exception as e:
             self.logger.error(f"Boundary detection failed: {e}")
-            # Fallback: create simple time-based segments
+            # Fallback: create simple time-based segments (at least start/end)
             duration = len(features['energy']) * self.hop_length / sample_rate
-            return np.linspace(0, duration, min(8, int(duration / 30)))  # 30s segments max
+            return np.linspace(0, duration, max(2, min(8, int(duration / 30) + 2)))
     
+    def _laplacian_boundaries(self, feature_matrix: np.ndarray,
+                              n_segments: int) -> np.ndarray:
+        """Boundary frames via spectral clustering of a sparse recurrence graph.
+
+        The affinity recurrence matrix is O(N*k) in memory instead of the
+        dense O(N^2) similarity matrix agglomerative clustering builds.
+        Falls back to agglomerative when the track is too short for a
+        meaningful graph.
+        """
+        n_frames = feature_matrix.shape[1]
+        if n_frames < 4 * n_segments or not SCIPY_AVAILABLE:
+            return librosa.segment.agglomerative(feature_matrix, n_segments)
+
+        import scipy.sparse
+        import scipy.sparse.linalg
+        from sklearn.cluster import KMeans
+
+        recurrence = librosa.segment.recurrence_matrix(
+            feature_matrix, width=3, mode='affinity', sym=True, sparse=True
+        )
+
+        # Normalized graph Laplacian, eigenvectors of the smallest modes
+        degree = np.asarray(recurrence.sum(axis=1)).ravel()
+        laplacian = scipy.sparse.diags(degree) - recurrence
+        k = min(max(2, n_segments), n_frames - 2)
+        _, eigenvectors = scipy.sparse.linalg.eigsh(
+            laplacian.asfptype(), k=k, sigma=1e-8, which='LM'
+        )
+
+        labels = KMeans(n_clusters=n_segments, n_init=4, random_state=0).fit_predict(eigenvectors)
+
+        change_points = np.flatnonzero(labels[1:] != labels[:-1]) + 1
+        return np.concatenate(([0], change_points))
+
     def _combine_features_for_segmentation(self, features: Dict[str, np.ndarray]) -> np.ndarray:
-        """Combine features into matrix for segmentation."""
-        feature_list = []
-        
-        # Add energy (normalized)
-        energy_norm = features['energy'] / (np.max(features['energy']) + 1e-8)
-        feature_list.append(energy_norm)
-        
-        # Add spectral centroid (normalized)
-        centroid_norm = features['spectral_centroid'] / (np.max(features['spectral_centroid']) + 1e-8)
-        feature_list.append(centroid_norm)
-        
-        # Add first few MFCCs
-        for i in range(min(5, features['mfcc'].shape[0])):
-            mfcc_norm = features['mfcc'][i] / (np.max(np.abs(features['mfcc'][i])) + 1e-8)
-            feature_list.append(mfcc_norm)
-        
-        # Add chroma features (sum across octaves)
-        chroma_sum = np.sum(features['chroma'], axis=0)
-        chroma_norm = chroma_sum / (np.max(chroma_sum) + 1e-8)
-        feature_list.append(chroma_norm)
-        
-        # Stack features
-        feature_matrix = np.vstack(feature_list)
+        """Combine features into matrix for segmentation.
+
+        Rows are filled into one preallocated float32 matrix and normalized
+        in a single 2D pass (energy/centroid/chroma are non-negative, so
+        max-abs normalization matches the previous per-row maxima).
+        """
+        n_frames = len(features['energy'])
+        n_mfcc = min(5, features['mfcc'].shape[0])
+        has_chroma = 'chroma' in features
+        n_rows = 2 + n_mfcc + (1 if has_chroma else 0)
+
+        feature_matrix = np.empty((n_rows, n_frames), dtype=np.float32)
+        feature_matrix[0] = features['energy']
+        feature_matrix[1] = features['spectral_centroid']
+        feature_matrix[2:2 + n_mfcc] = features['mfcc'][:n_mfcc]
+        if has_chroma:
+            feature_matrix[2 + n_mfcc] = np.sum(features['chroma'], axis=0)
+
+        norms = np.maximum(np.max(np.abs(feature_matrix), axis=1, keepdims=True),
+                           np.float32(1e-8))
+        feature_matrix /= norms
 
         return feature_matrix
 
@@ -379,6 +743,11 @@ class StructureAnalyzer:
         """Classify detected segments into structure types."""
         sections = []
 
+        # Prefix sums turn every per-segment mean/variance into two O(1)
+        # subtractions instead of a fresh slice reduction
+        cumulative = self._feature_prefix_sums(features)
+
+        candidates = []
         for i in range(len(boundaries) - 1):
             start_time = boundaries[i]
             end_time = boundaries[i + 1]
@@ -389,16 +758,26 @@ class StructureAnalyzer:
 
             # Extract features for this segment
             segment_features = self._extract_segment_features(
-                start_time, end_time, features, sample_rate
+                start_time, end_time, features, sample_rate, cumulative
             )
+            candidates.append((start_time, end_time, segment_features))
 
-            # Classify segment type
-            section_type, confidence = self._classify_segment_type(
-                segment_features, start_time, end_time, len(sections), beatgrid_data
-            )
+        if not candidates:
+            return sections
+
+        # Classify every candidate in one vectorized pass
+        starts = np.array([c[0] for c in candidates])
+        ends = np.array([c[1] for c in candidates])
+        classified = self._classify_segment_types_batch(
+            np.array([c[2]['avg_energy'] for c in candidates]),
+            np.array([c[2]['avg_spectral_centroid'] for c in candidates]),
+            np.array([c[2]['energy_variance'] for c in candidates]),
+            np.array([c[2]['tempo_stability'] for c in candidates]),
+            starts / (ends + starts),  # Rough position in track
+        )
 
-            # Create structure section
-            section = StructureSection(
+        for (start_time, end_time, segment_features), (section_type, confidence) in zip(candidates, classified):
+            sections.append(StructureSection(
                 type=section_type,
                 start_time=start_time,
                 end_time=end_time,
@@ -406,15 +785,23 @@ class StructureAnalyzer:
                 energy_level=segment_features['avg_energy'],
                 spectral_centroid=segment_features['avg_spectral_centroid'],
                 tempo_stability=segment_features['tempo_stability']
-            )
-
-            sections.append(section)
+            ))
 
         return sections
 
+    def _feature_prefix_sums(self, features: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Prefix sums (and sums of squares) for O(1) windowed statistics."""
+        cumulative = {}
+        for name in ('energy', 'spectral_centroid'):
+            values = features[name].astype(np.float64)
+            cumulative[name] = np.concatenate(([0.0], np.cumsum(values)))
+            cumulative[name + '_sq'] = np.concatenate(([0.0], np.cumsum(values * values)))
+        return cumulative
+
     def _extract_segment_features(self, start_time: float, end_time: float,
                                  features: Dict[str, np.ndarray],
-                                 sample_rate: int) -> Dict[str, float]:
+                                 sample_rate: int,
+                                 cumulative: Dict[str, np.ndarray]) -> Dict[str, float]:
         """Extract aggregated features for a segment."""
         # Convert times to frame indices
         start_frame = int(start_time * sample_rate / self.hop_length)
@@ -434,40 +821,46 @@ class StructureAnalyzer:
                 'tempo_stability': 0.0
             }
 
-        # Extract segment data
-        segment_energy = features['energy'][start_frame:end_frame]
-        segment_centroid = features['spectral_centroid'][start_frame:end_frame]
+        # Windowed mean/variance from the prefix sums (var = E[x^2] - E[x]^2)
+        n_frames = end_frame - start_frame
+
+        def window_stats(name: str) -> Tuple[float, float]:
+            total = cumulative[name][end_frame] - cumulative[name][start_frame]
+            total_sq = cumulative[name + '_sq'][end_frame] - cumulative[name + '_sq'][start_frame]
+            mean = total / n_frames
+            variance = max(0.0, total_sq / n_frames - mean * mean)
+            return mean, variance
+
+        avg_energy, energy_variance = window_stats('energy')
+        avg_centroid, spectral_variance = window_stats('spectral_centroid')
+
         segment_onset = features['onset_strength'][start_frame:end_frame]
 
-        # Calculate aggregated features
-        segment_features = {
-            'avg_energy': np.mean(segment_energy),
-            'avg_spectral_centroid': np.mean(segment_centroid),
-            'energy_variance': np.var(segment_energy),
-            'spectral_variance': np.var(segment_centroid),
+        return {
+            'avg_energy': avg_energy,
+            'avg_spectral_centroid': avg_centroid,
+            'energy_variance': energy_variance,
+            'spectral_variance': spectral_variance,
             'tempo_stability': self._calculate_tempo_stability(segment_onset)
         }
 
-        return segment_features
-
     def _calculate_tempo_stability(self, onset_strength: np.ndarray) -> float:
         """Calculate tempo stability for a segment."""
         if len(onset_strength) < 10:
             return 0.0
 
         try:
-            # Calculate autocorrelation to find periodic patterns
-            autocorr = np.correlate(onset_strength, onset_strength, mode='full')
-            autocorr = autocorr[len(autocorr)//2:]
-
-            # Find peaks in autocorrelation
-            if SCIPY_AVAILABLE:
-                peaks, _ = scipy.signal.find_peaks(autocorr, height=np.max(autocorr) * 0.3)
-                if len(peaks) > 1:
-                    # Measure consistency of peak spacing
-                    peak_diffs = np.diff(peaks)
-                    stability = 1.0 - (np.std(peak_diffs) / (np.mean(peak_diffs) + 1e-8))
-                    return max(0.0, min(1.0, stability))
+            # FFT-based autocorrelation - O(N log N) instead of the O(N^2)
+            # np.correlate, and only the positive-lag half is computed
+            n = len(onset_strength)
+            spectrum = np.fft.rfft(onset_strength, n=2 * n)
+            autocorr = np.fft.irfft(spectrum * np.conj(spectrum), n=2 * n)[:n]
+
+            # Measure consistency of autocorrelation peak spacing in one
+            # compiled pass (replaces scipy.signal.find_peaks + diff/std)
+            stability = _peak_spacing_stability(autocorr, float(np.max(autocorr)) * 0.3)
+            if stability >= 0.0:
+                return stability
 
             # Fallback: measure variance in onset strength
             return 1.0 - (np.std(onset_strength) / (np.mean(onset_strength) + 1e-8))
@@ -475,62 +868,73 @@ class StructureAnalyzer:
         except Exception:
             return 0.5  # Default moderate stability
 
-    def _classify_segment_type(self, segment_features: Dict[str, float],
-                              start_time: float, end_time: float,
-                              segment_index: int,
-                              beatgrid_data: Optional[BeatgridData] = None) -> Tuple[StructureType, float]:
-        """Classify a segment into a structure type."""
-        duration = end_time - start_time
-        track_position = start_time / (end_time + start_time)  # Rough position in track
-
-        # Feature-based classification rules
-        energy = segment_features['avg_energy']
-        spectral_centroid = segment_features['avg_spectral_centroid']
-        energy_variance = segment_features['energy_variance']
-        tempo_stability = segment_features['tempo_stability']
-
-        # Normalize features (rough normalization)
-        energy_norm = min(1.0, energy * 10)  # Assume typical energy range
-        centroid_norm = min(1.0, spectral_centroid / 4000)  # Assume 4kHz max
-
-        # Classification logic based on position and features
-        confidence = 0.5  # Base confidence
-
+    # Classification rules in priority order: (type, confidence). Each mask
+    # builder receives (energy, centroid, energy_var, stability, position)
+    # arrays, so one call classifies every segment at once.
+    _CLASSIFICATION_RULES = (
         # Intro detection (beginning of track, moderate energy)
-        if track_position < 0.15 and energy_norm < 0.6:
-            return StructureType.INTRO, min(0.9, confidence + 0.3)
-
+        (StructureType.INTRO, 0.8,
+         lambda e, c, v, s, p: (p < 0.15) & (e < 0.6)),
         # Outro detection (end of track, decreasing energy)
-        elif track_position > 0.85 and energy_norm < 0.5:
-            return StructureType.OUTRO, min(0.9, confidence + 0.3)
-
+        (StructureType.OUTRO, 0.8,
+         lambda e, c, v, s, p: (p > 0.85) & (e < 0.5)),
         # Drop detection (high energy, high spectral content)
-        elif energy_norm > 0.8 and centroid_norm > 0.7:
-            return StructureType.DROP, min(0.9, confidence + 0.4)
-
+        (StructureType.DROP, 0.9,
+         lambda e, c, v, s, p: (e > 0.8) & (c > 0.7)),
         # Breakdown detection (low energy, low spectral content)
-        elif energy_norm < 0.3 and centroid_norm < 0.4:
-            return StructureType.BREAKDOWN, min(0.8, confidence + 0.3)
-
+        (StructureType.BREAKDOWN, 0.8,
+         lambda e, c, v, s, p: (e < 0.3) & (c < 0.4)),
         # Buildup detection (increasing energy, high variance)
-        elif energy_variance > 0.1 and tempo_stability > 0.7:
-            return StructureType.BUILDUP, min(0.8, confidence + 0.2)
-
+        (StructureType.BUILDUP, 0.7,
+         lambda e, c, v, s, p: (v > 0.1) & (s > 0.7)),
         # Chorus detection (high energy, stable tempo)
-        elif energy_norm > 0.6 and tempo_stability > 0.6:
-            return StructureType.CHORUS, min(0.8, confidence + 0.2)
-
+        (StructureType.CHORUS, 0.7,
+         lambda e, c, v, s, p: (e > 0.6) & (s > 0.6)),
         # Verse detection (moderate energy, stable)
-        elif 0.3 < energy_norm < 0.7 and tempo_stability > 0.5:
-            return StructureType.VERSE, min(0.7, confidence + 0.1)
-
+        (StructureType.VERSE, 0.6,
+         lambda e, c, v, s, p: (e > 0.3) & (e < 0.7) & (s > 0.5)),
         # Bridge detection (moderate features, middle position)
-        elif 0.3 < track_position < 0.7 and energy_norm > 0.4:
-            return StructureType.BRIDGE, min(0.6, confidence)
+        (StructureType.BRIDGE, 0.5,
+         lambda e, c, v, s, p: (p > 0.3) & (p < 0.7) & (e > 0.4)),
+    )
+
+    def _classify_segment_types_batch(self, energy: np.ndarray, centroid: np.ndarray,
+                                      energy_var: np.ndarray, stability: np.ndarray,
+                                      position: np.ndarray) -> List[Tuple[StructureType, float]]:
+        """Classify all segments in one vectorized pass.
+
+        Every rule mask is evaluated over the whole segment batch; the
+        first matching rule (priority order) wins via argmax over the
+        stacked masks, with an always-true UNKNOWN fallthrough row.
+        """
+        energy_norm = np.minimum(1.0, energy)
+        centroid_norm = np.minimum(1.0, centroid / 4000)  # Assume 4kHz max
+
+        masks = [rule(energy_norm, centroid_norm, energy_var, stability, position)
+                 for _, _, rule in self._CLASSIFICATION_RULES]
+        masks.append(np.ones(len(energy), dtype=bool))  # UNKNOWN fallthrough
+
+        assigned = np.argmax(np.stack(masks), axis=0)
+
+        types = tuple(rule_type for rule_type, _, _ in self._CLASSIFICATION_RULES) + (StructureType.UNKNOWN,)
+        confidences = tuple(conf for _, conf, _ in self._CLASSIFICATION_RULES) + (0.5,)
+
+        return [(types[index], confidences[index]) for index in assigned]
+
+    def _classify_segment_type(self, segment_features: Dict[str, float],
+                              start_time: float, end_time: float,
+                              segment_index: int,
+                              beatgrid_data: Optional[BeatgridData] = None) -> Tuple[StructureType, float]:
+        """Classify a segment into a structure type."""
+        track_position = start_time / (end_time + start_time)  # Rough position in track
 
-        # Default to unknown
-        else:
-            return StructureType.UNKNOWN, confidence
+        return self._classify_segment_types_batch(
+            np.array([segment_features['avg_energy']]),
+            np.array([segment_features['avg_spectral_centroid']]),
+            np.array([segment_features['energy_variance']]),
+            np.array([segment_features['tempo_stability']]),
+            np.array([track_position]),
+        )[0]
 
     def _post_process_sections(self, sections: List[StructureSection],
                               track_duration: float) -> List[StructureSection]:
@@ -579,11 +983,16 @@ class StructureAnalyzer:
             sections[-1].confidence = min(0.8, sections[-1].confidence + 0.2)
 
         # Rule 3: High energy sections after buildups are likely drops
-        for i in range(len(sections) - 1):
-            if (sections[i].type == StructureType.BUILDUP and
-                sections[i+1].energy_level > 0.7):
-                sections[i+1].type = StructureType.DROP
-                sections[i+1].confidence = min(0.9, sections[i+1].confidence + 0.3)
+        # (one vectorized pass over SoA gathers of the section fields)
+        energies = np.fromiter((s.energy_level for s in sections),
+                               dtype=np.float64, count=len(sections))
+        is_buildup = np.fromiter((s.type == StructureType.BUILDUP for s in sections),
+                                 dtype=bool, count=len(sections))
+
+        for index in np.flatnonzero(is_buildup[:-1] & (energies[1:] > 0.7)):
+            target = sections[index + 1]
+            target.type = StructureType.DROP
+            target.confidence = min(0.9, target.confidence + 0.3)
 
         return sections
 
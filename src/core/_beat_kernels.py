@@ -0,0 +1,56 @@
+"""
+Numba-compiled kernels for beatgrid analysis
+Tight numeric loops promoted out of BeatgridEngine for JIT compilation
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def filter_close_beats(beats: np.ndarray, min_interval: float) -> np.ndarray:
+    """Drop beats closer than min_interval to the previously kept beat.
+
+    Walks the sorted array once into a preallocated buffer; JIT-compiled
+    when numba is available.
+    """
+    out = np.empty(beats.shape[0])
+    out[0] = beats[0]
+    count = 1
+    for i in range(1, beats.shape[0]):
+        if beats[i] - out[count - 1] >= min_interval:
+            out[count] = beats[i]
+            count += 1
+    return out[:count]
+
+
+def interpolate_midpoints(beats: np.ndarray, out: np.ndarray) -> None:
+    """Interleave beats with their midpoints into out (length 2*n - 1)."""
+    n = beats.shape[0]
+    for i in range(n - 1):
+        out[2 * i] = beats[i]
+        out[2 * i + 1] = 0.5 * (beats[i] + beats[i + 1])
+    out[2 * n - 2] = beats[n - 1]
+
+
+# No cache=True: these modules are imported both as core.* and src.core.*,
+# and numba's on-disk cache is keyed by module path
+if NUMBA_AVAILABLE:
+    filter_close_beats = njit(nogil=True)(filter_close_beats)
+    interpolate_midpoints = njit(nogil=True)(interpolate_midpoints)
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation of the beat kernels.
+
+    Called from BeatgridEngine.__init__ rather than at import so code that
+    never runs beat analysis doesn't pay the compile cost just for
+    importing the package.
+    """
+    beats = np.array([0.0, 1.0])
+    filter_close_beats(beats, 0.5)
+    interpolate_midpoints(beats, np.empty(3))
@@ -13,45 +13,69 @@ from dataclasses import dataclass, field
 from collections import deque, defaultdict
 import statistics
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class PerformanceMetric:
-    """Individual performance metric with statistics."""
+    """Individual performance metric with statistics.
+
+    Recent samples live in a fixed-size NumPy ring buffer, so recording is
+    O(1) with no allocations and the statistics are vector reductions.
+    """
     name: str
-    values: deque = field(default_factory=lambda: deque(maxlen=1000))
+    buffer_size: int = 1000
     total_count: int = 0
     total_time: float = 0.0
     min_time: float = float('inf')
     max_time: float = 0.0
-    
+    _buffer: np.ndarray = field(init=False, repr=False)
+    _write_index: int = field(init=False, repr=False)
+    _filled: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._buffer = np.zeros(self.buffer_size)
+        self._write_index = 0
+        self._filled = 0
+
+    @property
+    def values(self) -> np.ndarray:
+        """View of the currently held samples (unordered once wrapped)."""
+        return self._buffer[:self._filled]
+
     def add_measurement(self, value: float) -> None:
         """Add a new measurement."""
-        self.values.append(value)
+        self._buffer[self._write_index] = value
+        self._write_index = (self._write_index + 1) % self.buffer_size
+        if self._filled < self.buffer_size:
+            self._filled += 1
+
         self.total_count += 1
         self.total_time += value
-        self.min_time = min(self.min_time, value)
-        self.max_time = max(self.max_time, value)
-    
+        if value < self.min_time:
+            self.min_time = value
+        if value > self.max_time:
+            self.max_time = value
+
     @property
     def average(self) -> float:
         """Get average time."""
         return self.total_time / max(1, self.total_count)
-    
+
     @property
     def recent_average(self) -> float:
         """Get average of recent measurements."""
-        if not self.values:
+        if not self._filled:
             return 0.0
-        return statistics.mean(self.values)
-    
+        return float(np.mean(self.values))
+
     @property
     def percentile_95(self) -> float:
         """Get 95th percentile of recent measurements."""
-        if not self.values:
+        if not self._filled:
             return 0.0
-        sorted_values = sorted(self.values)
-        index = int(0.95 * len(sorted_values))
-        return sorted_values[min(index, len(sorted_values) - 1)]
+        index = min(int(0.95 * self._filled), self._filled - 1)
+        return float(np.partition(self.values, index)[index])
 
 
 class AdvancedPerformanceMonitor:
@@ -18,6 +18,8 @@ from pydub.utils import which
 import librosa
 import soundfile as sf
 
+from .buffer_pool import Float32Pool
+
 
 @dataclass
 class AudioData:
@@ -58,6 +60,10 @@ class AudioLoader:
         # Thread pool for background loading
         self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="AudioLoader")
         self._loading_lock = threading.Lock()
+
+        # Scratch buffer pool - repeated waveform/RMS passes (GUI redraws)
+        # reuse float32 work arrays instead of reallocating
+        self._buffer_pool = Float32Pool()
         
         # Check FFmpeg availability
         self._check_dependencies()
@@ -389,50 +395,68 @@ class AudioLoader:
             zoom_levels = [1, 2, 4, 8, 16, 32, 64, 128]
 
         waveform_data = {}
-        total_samples = audio_data.data.shape[-1]
+        data = np.atleast_2d(audio_data.data)
+        n_channels = data.shape[0]
+        total_samples = data.shape[-1]
 
         self.logger.info(f"Generating waveform data for {len(zoom_levels)} zoom levels")
 
-        for zoom in zoom_levels:
-            # Calculate samples per pixel at this zoom level
-            target_pixels = target_width * zoom
-            samples_per_pixel = max(1, total_samples // target_pixels)
+        # Process finest scale first, then derive coarser scales by grouping
+        # already-reduced pixels (audio mipmap) - the source buffer is read
+        # only once regardless of the number of zoom levels.
+        samples_per_pixel_map = {
+            zoom: max(1, total_samples // (target_width * zoom))
+            for zoom in zoom_levels
+        }
+        finer_scales = []  # (samples_per_pixel, peaks, rms), finest first
+
+        for zoom in sorted(zoom_levels, key=samples_per_pixel_map.__getitem__):
+            samples_per_pixel = samples_per_pixel_map[zoom]
 
             if samples_per_pixel == 1:
                 # No downsampling needed - use original data
+                abs_data = np.abs(data)
                 waveform_data[zoom] = {
                     'peaks': audio_data.data,
-                    'rms': np.abs(audio_data.data),  # For single samples, RMS = abs
+                    'rms': abs_data,  # For single samples, RMS = abs
                     'samples_per_pixel': 1
                 }
+                finer_scales.append((1, abs_data, abs_data))
+                continue
+
+            n_pixels = total_samples // samples_per_pixel
+            if n_pixels == 0:
+                continue
+
+            # Prefer the coarsest finer scale whose pixel size divides this
+            # one evenly - grouping reduced pixels is exact for both peak
+            # (max of maxes) and RMS (sqrt of mean of squares)
+            source = None
+            for finer_spp, finer_peaks, finer_rms in reversed(finer_scales):
+                if samples_per_pixel % finer_spp == 0:
+                    source = (finer_spp, finer_peaks, finer_rms)
+                    break
+
+            if source is not None:
+                group = samples_per_pixel // source[0]
+                peaks = source[1][:, :n_pixels * group].reshape(
+                    n_channels, n_pixels, group).max(axis=2)
+                rms = np.sqrt(
+                    (source[2][:, :n_pixels * group] ** 2).reshape(
+                        n_channels, n_pixels, group).mean(axis=2))
             else:
-                # Downsample with both peaks and RMS
-                peaks_channels = []
-                rms_channels = []
-
-                for channel in audio_data.data:
-                    # Calculate number of complete pixels
-                    n_pixels = len(channel) // samples_per_pixel
-                    if n_pixels == 0:
-                        continue
-
-                    # Reshape to groups of samples_per_pixel
-                    reshaped = channel[:n_pixels * samples_per_pixel].reshape(n_pixels, samples_per_pixel)
-
-                    # Calculate peaks (max absolute value) for each pixel
-                    peaks = np.max(np.abs(reshaped), axis=1)
-                    peaks_channels.append(peaks)
-
-                    # Calculate RMS for each pixel
-                    rms = np.sqrt(np.mean(reshaped**2, axis=1))
-                    rms_channels.append(rms)
-
-                if peaks_channels:  # Only add if we have data
-                    waveform_data[zoom] = {
-                        'peaks': np.array(peaks_channels),
-                        'rms': np.array(rms_channels),
-                        'samples_per_pixel': samples_per_pixel
-                    }
+                # Reshape to groups of samples_per_pixel (all channels at once)
+                reshaped = data[:, :n_pixels * samples_per_pixel].reshape(
+                    n_channels, n_pixels, samples_per_pixel)
+                peaks = np.max(np.abs(reshaped), axis=2)
+                rms = np.sqrt(np.mean(reshaped**2, axis=2))
+
+            waveform_data[zoom] = {
+                'peaks': peaks,
+                'rms': rms,
+                'samples_per_pixel': samples_per_pixel
+            }
+            finer_scales.append((samples_per_pixel, peaks, rms))
 
         self.logger.info(f"Generated waveform data for zoom levels: {list(waveform_data.keys())}")
         return waveform_data
@@ -450,21 +474,27 @@ class AudioLoader:
             RMS energy array for each channel
         """
         rms_channels = []
+        hop_size = window_size // 2
 
         for channel in audio_data.data:
-            # Calculate RMS in overlapping windows
-            hop_size = window_size // 2
             n_windows = (len(channel) - window_size) // hop_size + 1
 
-            rms_values = []
-            for i in range(n_windows):
-                start = i * hop_size
-                end = start + window_size
-                window = channel[start:end]
-                rms = np.sqrt(np.mean(window**2))
-                rms_values.append(rms)
+            if n_windows <= 0:
+                rms_channels.append(np.array([]))
+                continue
+
+            # Vectorized RMS over overlapping windows (zero-copy strided view)
+            windows = np.lib.stride_tricks.sliding_window_view(
+                channel, window_size
+            )[::hop_size][:n_windows]
 
-            rms_channels.append(np.array(rms_values))
+            if windows.dtype == np.float32:
+                # Square into a pooled scratch buffer - no per-call temporary
+                with self._buffer_pool.borrow(windows.shape) as squared:
+                    np.multiply(windows, windows, out=squared)
+                    rms_channels.append(np.sqrt(np.mean(squared, axis=1)))
+            else:
+                rms_channels.append(np.sqrt(np.mean(windows**2, axis=1)))
 
         return np.array(rms_channels)
 
@@ -484,16 +514,21 @@ class AudioLoader:
 
     def optimize_memory_usage(self, audio_data: AudioData) -> AudioData:
         """Optimize memory usage for large audio files."""
+        # Already at target precision - skip the (comparatively expensive)
+        # process memory poll entirely
+        if audio_data.data.dtype == np.float32:
+            return audio_data
+
+        # Convert to lower precision (copy=False is free if no cast is needed)
+        if audio_data.data.dtype == np.float64:
+            self.logger.info("Converting from float64 to float32 to save memory")
+            audio_data.data = audio_data.data.astype(np.float32, copy=False)
+
         current_memory = self.get_memory_usage()
 
         if current_memory['rss_mb'] > self.memory_limit_mb:
             self.logger.warning(f"Memory usage {current_memory['rss_mb']:.1f}MB exceeds limit {self.memory_limit_mb}MB")
 
-            # Convert to lower precision if needed
-            if audio_data.data.dtype == np.float64:
-                self.logger.info("Converting from float64 to float32 to save memory")
-                audio_data.data = audio_data.data.astype(np.float32)
-
             # For very large files, consider chunked processing
             if audio_data.duration > 600:  # 10 minutes
                 self.logger.info("Large file detected - consider chunked processing for better memory usage")
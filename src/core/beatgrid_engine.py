@@ -30,7 +30,26 @@ except ImportError:
     AUBIO_AVAILABLE = False
     logging.warning("aubio not available - using madmom only")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from .audio_loader import AudioData
+from . import _beat_kernels
+
+
+def _tap_tempo(times: np.ndarray) -> float:
+    """Compute BPM from tap timestamps (JIT-compiled when numba is available)."""
+    intervals = np.diff(times)
+    return 60.0 / np.mean(intervals)
+
+
+# No cache=True: the module is imported both as core.beatgrid_engine and
+# src.core.beatgrid_engine, and numba's on-disk cache is keyed by module path
+if NUMBA_AVAILABLE:
+    _tap_tempo = njit(_tap_tempo)
 
 
 @dataclass
@@ -71,7 +90,11 @@ class BeatgridEngine:
         
         # Initialize processors
         self._init_processors()
-        
+
+        # Warm the beat kernels so the first analysis doesn't pay JIT
+        # compile cost
+        _beat_kernels.warm_up()
+
         # Thread safety
         self._analysis_lock = threading.Lock()
         
@@ -221,20 +244,17 @@ class BeatgridEngine:
         if len(beats) <= 1:
             return beats
 
-        filtered_beats = [beats[0]]
-
-        for beat in beats[1:]:
-            if beat - filtered_beats[-1] >= min_interval:
-                filtered_beats.append(beat)
-
-        return np.array(filtered_beats)
+        return _beat_kernels.filter_close_beats(
+            np.ascontiguousarray(beats, dtype=np.float64), min_interval)
 
     def _calculate_bpm_and_confidence(self, beats: np.ndarray) -> Tuple[float, float]:
         """Calculate BPM and confidence with improved algorithm."""
         if len(beats) < 2:
             return 0.0, 0.0
 
-        intervals = np.diff(beats)
+        # Stride-1 float64 input keeps the diff/percentile reductions on
+        # the fast contiguous path
+        intervals = np.diff(np.ascontiguousarray(beats, dtype=np.float64))
 
         # Remove outliers using IQR method
         q1, q3 = np.percentile(intervals, [25, 75])
@@ -267,14 +287,10 @@ class BeatgridEngine:
         if len(beats) < 2:
             return beats
 
-        new_beats = []
-        for i in range(len(beats) - 1):
-            new_beats.append(beats[i])
-            # Insert beat halfway between current and next
-            new_beats.append((beats[i] + beats[i + 1]) / 2)
-        new_beats.append(beats[-1])
-
-        return np.array(new_beats)
+        out = np.empty(2 * len(beats) - 1)
+        _beat_kernels.interpolate_midpoints(
+            np.ascontiguousarray(beats, dtype=np.float64), out)
+        return out
 
     def _detect_downbeats(self, beats: np.ndarray, bpm: float) -> np.ndarray:
         """Detect downbeats with improved algorithm."""
@@ -382,12 +398,8 @@ class BeatgridEngine:
         """
         if len(tap_times) < 2:
             raise BeatgridError("Need at least 2 taps")
-        
-        intervals = np.diff(tap_times)
-        avg_interval = np.mean(intervals)
-        bpm = 60.0 / avg_interval
-        
-        return bpm
+
+        return float(_tap_tempo(np.asarray(tap_times, dtype=np.float64)))
     
     def adjust_beatgrid(self, beatgrid: BeatgridData, 
                        first_beat_offset: float,
@@ -0,0 +1,69 @@
+"""
+Float32 Buffer Pool - Reusable NumPy scratch buffers
+Bounds allocator churn on hot paths that need short-lived arrays
+"""
+
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class Float32Pool:
+    """
+    Thread-safe LIFO pool of float32 scratch buffers keyed by shape.
+
+    Buffers come back uninitialized (like np.empty) and must not be used
+    after release. Pooled memory is bounded: releases past max_bytes drop
+    the buffer for the garbage collector instead of retaining it.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._buffers: Dict[Tuple[int, ...], deque] = defaultdict(deque)
+        self._pooled_bytes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, shape) -> np.ndarray:
+        """Get a float32 buffer of the given shape, reusing one if pooled."""
+        if isinstance(shape, int):
+            shape = (shape,)
+        else:
+            shape = tuple(shape)
+
+        with self._lock:
+            stack = self._buffers.get(shape)
+            if stack:
+                buffer = stack.pop()
+                self._pooled_bytes -= buffer.nbytes
+                return buffer
+
+        return np.empty(shape, dtype=np.float32)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool for reuse."""
+        if buffer.dtype != np.float32:
+            raise ValueError(f"Pool only holds float32 buffers, got {buffer.dtype}")
+
+        with self._lock:
+            if self._pooled_bytes + buffer.nbytes > self.max_bytes:
+                return  # Over budget - let the GC have it
+
+            self._buffers[buffer.shape].append(buffer)
+            self._pooled_bytes += buffer.nbytes
+
+    @contextmanager
+    def borrow(self, shape):
+        """Context manager form of acquire/release."""
+        buffer = self.acquire(shape)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    @property
+    def pooled_bytes(self) -> int:
+        """Total bytes currently held by the pool."""
+        return self._pooled_bytes
@@ -6,7 +6,7 @@ Supports ID3v2.4, MP4, Vorbis with backup and rollback capabilities
 import logging
 import shutil
 import time
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
 import json
@@ -30,8 +30,14 @@ except ImportError:
     TAGLIB_AVAILABLE = False
     logging.warning("pytaglib not available - using mutagen only")
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 
-@dataclass
+@dataclass(slots=True)
 class TrackMetadata:
     """Container for track metadata."""
     # Basic metadata
@@ -135,6 +141,7 @@ class MetadataParser:
         # Performance tracking
         self._metadata_cache: Dict[str, TrackMetadata] = {}
         self._file_checksums: Dict[str, str] = {}
+        self._backup_registry: Dict[Path, Tuple[int, int]] = {}
         self._operation_stats = {
             'reads': 0, 'writes': 0, 'cache_hits': 0, 'cache_misses': 0,
             'repairs': 0, 'backups_created': 0, 'rollbacks': 0
@@ -691,9 +698,25 @@ class MetadataParser:
             return False
 
     def _create_backup(self, file_path: Path) -> Path:
-        """Create backup of file before writing."""
+        """Create backup of file before writing.
+
+        Re-backing-up a file unchanged since the last backup is skipped via
+        an in-process registry keyed on (inode, mtime_ns). Hard links are
+        deliberately not used: tags are written into the file in place,
+        which would corrupt a linked backup.
+        """
         backup_path = file_path.with_suffix(f'{file_path.suffix}.backup')
+
+        stat = file_path.stat()
+        signature = (stat.st_ino, stat.st_mtime_ns)
+
+        if (self._backup_registry.get(backup_path) == signature
+                and backup_path.exists()):
+            self.logger.debug(f"Backup already current: {backup_path}")
+            return backup_path
+
         shutil.copy2(file_path, backup_path)
+        self._backup_registry[backup_path] = signature
         self.logger.debug(f"Created backup: {backup_path}")
         return backup_path
 
@@ -732,7 +755,7 @@ class MetadataParser:
 
         # Check if file has been modified
         try:
-            current_checksum = self._calculate_file_checksum(file_path)
+            current_checksum = self._calculate_file_checksum(file_path, quick=True)
             cached_checksum = self._file_checksums.get(file_key)
 
             if current_checksum == cached_checksum:
@@ -750,7 +773,7 @@ class MetadataParser:
     def _cache_metadata(self, file_path: Path, file_key: str, metadata: TrackMetadata) -> None:
         """Cache metadata with file checksum."""
         try:
-            checksum = self._calculate_file_checksum(file_path)
+            checksum = self._calculate_file_checksum(file_path, quick=True)
             self._metadata_cache[file_key] = metadata
             self._file_checksums[file_key] = checksum
 
@@ -766,14 +789,38 @@ class MetadataParser:
         except Exception as e:
             self.logger.warning(f"Failed to cache metadata: {e}")
 
-    def _calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate file checksum for cache validation."""
+    def _calculate_file_checksum(self, file_path: Path, quick: bool = False) -> str:
+        """Calculate file checksum for cache validation.
+
+        quick=True always uses the stat fingerprint - callers validating a
+        cache entry should not pay an O(file size) hash per lookup. With
+        integrity_checks enabled the full content is hashed - BLAKE3 (SIMD,
+        multithreaded) when installed, otherwise SHA-256 over an mmap'd
+        view of the file. Otherwise a size/mtime fingerprint is used.
+        """
         import hashlib
 
-        # Use file size and modification time for quick checksum
-        stat = file_path.stat()
-        checksum_data = f"{stat.st_size}_{stat.st_mtime}".encode()
-        return hashlib.md5(checksum_data).hexdigest()
+        if quick or not self.integrity_checks:
+            # Quick fingerprint from file size and modification time
+            stat = file_path.stat()
+            checksum_data = f"{stat.st_size}_{stat.st_mtime}".encode()
+            return hashlib.md5(checksum_data, usedforsecurity=False).hexdigest()
+
+        if BLAKE3_AVAILABLE:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return f"blake3:{hasher.hexdigest()}"
+
+        # mmap hands OpenSSL the whole buffer in one GIL-releasing update
+        # with no per-chunk bytes allocations
+        import mmap
+
+        hasher = hashlib.new('sha256', usedforsecurity=False)
+        if file_path.stat().st_size > 0:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+        return f"sha256:{hasher.hexdigest()}"
 
     def _validate_metadata(self, metadata: TrackMetadata) -> List[str]:
         """Validate metadata for common issues."""
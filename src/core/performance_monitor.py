@@ -44,6 +44,7 @@ class PerformanceMonitor:
         self.target_fps = config.get('waveform', {}).get('rendering', {}).get('target_fps', 60)
         self.memory_limit_mb = config.get('audio', {}).get('memory_limit_mb', 100)
         self.enable_monitoring = config.get('performance', {}).get('memory_monitoring', True)
+        self.monitor_interval = config.get('performance', {}).get('monitor_interval', 1.0)
         
         # Metrics storage
         self.fps_history = deque(maxlen=100)  # Last 100 FPS measurements
@@ -204,7 +205,7 @@ class PerformanceMonitor:
     
     def _monitoring_loop(self) -> None:
         """Background monitoring loop."""
-        while not self._stop_monitoring.wait(1.0):  # Check every second
+        while not self._stop_monitoring.wait(self.monitor_interval):
             try:
                 # Update system metrics
                 self.get_memory_usage()
@@ -39,6 +39,20 @@ SERATO_COLORS = {
 # Reverse mapping for writing
 COLOR_TO_SERATO = {v: k for k, v in SERATO_COLORS.items()}
 
+# Palette as a frozenset for O(1) validation and as an (N, 3) RGB array for
+# vectorized nearest-color repair
+_SERATO_COLOR_SET = frozenset(SERATO_COLORS)
+_SERATO_PALETTE_VALUES = tuple(SERATO_COLORS)
+_SERATO_PALETTE_RGB = np.array(
+    [[(c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF] for c in _SERATO_PALETTE_VALUES],
+    dtype=np.int32
+)
+
+# Markers2 CUE entry layout: type + size header, then a fixed prefix of
+# id (1), position (4), RGB color (3), padding/flags (5) before the label
+_ENTRY_HEADER = struct.Struct('>4sI')
+_CUE_ENTRY_PREFIX = struct.Struct('>BI3s5s')
+
 
 class SeratoError(Exception):
     """Custom exception for Serato compatibility errors."""
@@ -298,37 +312,51 @@ class SeratoBridge:
             self.logger.warning(f"Failed to parse cue entry: {e}")
             return None
     
-    def _create_markers2(self, cue_points: List[CuePoint]) -> bytes:
-        """Create Serato Markers2 format data."""
-        data = bytearray(b'\x01\x01')  # Header
-        
+    @staticmethod
+    def pack_cues(cue_points: List[CuePoint], out: bytearray, offset: int) -> int:
+        """Pack cue entries into out at offset, returning the new offset.
+
+        The buffer must already be sized via markers2_size(); entries are
+        written in place with pack_into, no intermediate bytes objects.
+        """
+        prefix_size = _CUE_ENTRY_PREFIX.size
+
         for cue in cue_points:
-            # Create cue entry
-            entry_data = bytearray()
-            
-            # Cue ID
-            entry_data.append(cue.id)
-            
-            # Position (4 bytes, big endian)
-            entry_data.extend(struct.pack('>I', int(cue.position_ms)))
-            
-            # Color (3 bytes RGB)
-            serato_color = COLOR_TO_SERATO.get(cue.color, 0xCC0000)
-            entry_data.extend(struct.pack('>I', serato_color)[1:4])
-            
-            # Some padding/flags
-            entry_data.extend(b'\x00\x00\x00\x00\x00')
-            
-            # Label (null-terminated UTF-8)
             label_bytes = cue.label.encode('utf-8')
-            entry_data.extend(label_bytes)
-            entry_data.append(0)  # Null terminator
-            
-            # Add entry to data
-            data.extend(b'CUE\x00')  # Entry type
-            data.extend(struct.pack('>I', len(entry_data)))  # Entry size
-            data.extend(entry_data)
-        
+            entry_size = prefix_size + len(label_bytes) + 1
+
+            _ENTRY_HEADER.pack_into(out, offset, b'CUE\x00', entry_size)
+
+            serato_color = COLOR_TO_SERATO.get(cue.color, 0xCC0000)
+            _CUE_ENTRY_PREFIX.pack_into(
+                out, offset + _ENTRY_HEADER.size,
+                cue.id, int(cue.position_ms),
+                serato_color.to_bytes(3, 'big'), b''
+            )
+
+            # Label (null terminator is already zeroed)
+            label_start = offset + _ENTRY_HEADER.size + prefix_size
+            out[label_start:label_start + len(label_bytes)] = label_bytes
+
+            offset += _ENTRY_HEADER.size + entry_size
+
+        return offset
+
+    @staticmethod
+    def markers2_size(cue_points: List[CuePoint]) -> int:
+        """Total Markers2 payload size for the given cues, header included."""
+        return 2 + sum(
+            _ENTRY_HEADER.size + _CUE_ENTRY_PREFIX.size
+            + len(cue.label.encode('utf-8')) + 1
+            for cue in cue_points
+        )
+
+    def _create_markers2(self, cue_points: List[CuePoint]) -> bytes:
+        """Create Serato Markers2 format data."""
+        # One allocation for the whole payload, filled in place
+        data = bytearray(self.markers2_size(cue_points))
+        data[0:2] = b'\x01\x01'  # Header
+        self.pack_cues(cue_points, data, 2)
         return bytes(data)
     
     def _parse_beatgrid(self, geob_frame) -> Optional[BeatgridData]:
@@ -573,7 +601,7 @@ class SeratoBridge:
 
         # Check color validity
         if cue.serato_color is not None:
-            if cue.serato_color not in SERATO_COLORS:
+            if cue.serato_color not in _SERATO_COLOR_SET:
                 errors.append(f"Unknown Serato color: {cue.serato_color}")
 
         # Check label validity
@@ -603,9 +631,15 @@ class SeratoBridge:
                 repaired_data['position_ms'] = 0.0
 
             elif "Unknown Serato color" in error:
-                # Use default red color
-                repaired_data['serato_color'] = 0xCC0000
-                repaired_data['color'] = '#CC0000'
+                # Snap to the nearest palette color instead of forcing red
+                color_int = cue.serato_color or 0
+                rgb = np.array([(color_int >> 16) & 0xFF,
+                                (color_int >> 8) & 0xFF,
+                                color_int & 0xFF], dtype=np.int32)
+                index = int(np.argmin(((_SERATO_PALETTE_RGB - rgb) ** 2).sum(axis=1)))
+                nearest = _SERATO_PALETTE_VALUES[index]
+                repaired_data['serato_color'] = nearest
+                repaired_data['color'] = SERATO_COLORS[nearest]
 
             elif "Label too long" in error:
                 # Truncate label
@@ -18,15 +18,15 @@ from PyQt6.QtGui import QAction, QKeySequence, QDragEnterEvent, QDropEvent
 from .waveform_view import WaveformView
 from .transport_bar import TransportBar
 from .sidebar import Sidebar
-from ..core.audio_loader import AudioLoader, AudioData, AudioLoadError
-from ..core.beatgrid_engine import BeatgridEngine, BeatgridData, BeatgridError
-from ..core.performance_monitor import PerformanceMonitor
-from ..core.cue_manager import CueManager, CuePoint, CueType
-from ..core.metadata_parser import MetadataParser, TrackMetadata
-from ..core.serato_bridge import SeratoBridge
-from ..analysis.structure_analyzer import StructureAnalyzer, StructureAnalysisResult
+from core.audio_loader import AudioLoader, AudioData, AudioLoadError
+from core.beatgrid_engine import BeatgridEngine, BeatgridData, BeatgridError
+from core.performance_monitor import PerformanceMonitor
+from core.cue_manager import CueManager, CuePoint, CueType
+from core.metadata_parser import MetadataParser, TrackMetadata
+from core.serato_bridge import SeratoBridge
+from analysis.structure_analyzer import StructureAnalyzer, StructureAnalysisResult
 from .navigation_controls import NavigationControls
-from ..playback.audio_engine import AudioEngine, PlaybackState
+from playback.audio_engine import AudioEngine, PlaybackState
 
 
 class MainWindow(QMainWindow):
@@ -15,7 +15,7 @@ from PyQt6.QtGui import QFont, QPainter, QPen, QBrush, QColor
 
 import pyqtgraph as pg
 
-from ..core.audio_loader import AudioData
+from core.audio_loader import AudioData
 
 
 class MiniMapWidget(QWidget):
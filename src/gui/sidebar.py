@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor, QPalette, QFont, QAction, QKeySequence
 
-from ..core.cue_manager import CuePoint, CueType, CueManager
+from core.cue_manager import CuePoint, CueType, CueManager
 
 
 class CuePointWidget(QWidget):
@@ -212,7 +212,7 @@ class Sidebar(QWidget):
         # Cue list (scrollable)
         self.cue_scroll_area = QScrollArea()
         self.cue_scroll_area.setWidgetResizable(True)
-        self.cue_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarNever)
+        self.cue_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self.cue_container = QWidget()
         self.cue_container_layout = QVBoxLayout(self.cue_container)
@@ -244,7 +244,7 @@ class Sidebar(QWidget):
         # Structure list (scrollable)
         self.structure_scroll_area = QScrollArea()
         self.structure_scroll_area.setWidgetResizable(True)
-        self.structure_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarNever)
+        self.structure_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self.structure_container = QWidget()
         self.structure_container_layout = QVBoxLayout(self.structure_container)
@@ -4,6 +4,7 @@ Complete transport controls with play/pause, seeking, volume, and time display
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, QSlider,
@@ -12,7 +13,7 @@ from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, QSlider,
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 
-from ..playback.audio_engine import AudioEngine, PlaybackState
+from playback.audio_engine import AudioEngine, PlaybackState
 
 
 class TransportBar(QWidget):
@@ -42,6 +43,7 @@ class TransportBar(QWidget):
         self.current_position = 0.0
         self.is_seeking = False
         self.playback_state = PlaybackState.STOPPED
+        self._device_ids: list = []  # Device ids mirrored in device_combo
 
         # UI update timer
         self.update_timer = QTimer()
@@ -209,12 +211,20 @@ class TransportBar(QWidget):
         self.logger.debug("Audio engine connected to transport bar")
 
     def _update_device_list(self) -> None:
-        """Update audio device list."""
+        """Update audio device list, repopulating only when devices changed."""
         if not self.audio_engine:
             return
 
-        self.device_combo.clear()
         devices = self.audio_engine.get_available_devices()
+        device_ids = [device.id for device in devices]
+
+        # Skip the Qt model churn entirely when nothing changed (the common
+        # case for hot-plug polling)
+        if device_ids == self._device_ids:
+            return
+
+        self.device_combo.blockSignals(True)
+        self.device_combo.clear()
 
         for device in devices:
             device_text = f"{device.name} ({device.channels}ch, {device.latency*1000:.1f}ms)"
@@ -223,6 +233,12 @@ class TransportBar(QWidget):
             if device.is_default:
                 self.device_combo.setCurrentIndex(self.device_combo.count() - 1)
 
+        self.device_combo.blockSignals(False)
+        self._device_ids = device_ids
+
+        # Selection may have moved during the rebuild - emit a single change
+        self._on_device_changed(self.device_combo.currentIndex())
+
     def set_duration(self, duration_seconds: float) -> None:
         """Set track duration."""
         self.current_duration = duration_seconds
@@ -327,6 +343,11 @@ class TransportBar(QWidget):
 
     def _format_time(self, seconds: float) -> str:
         """Format time in MM:SS format."""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """Build the MM:SS string once per unique second - the display timer asks
+    for the same value many times per second."""
+    return f"{seconds // 60}:{seconds % 60:02d}"
@@ -17,8 +17,8 @@ from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 import pyqtgraph as pg
 from pyqtgraph.opengl import GLViewWidget, GLLinePlotItem, GLGridItem
 
-from ..core.audio_loader import AudioData
-from ..core.beatgrid_engine import BeatgridData
+from core.audio_loader import AudioData
+from core.beatgrid_engine import BeatgridData
 
 
 class WaveformView(QWidget):
@@ -12,7 +12,6 @@ from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QDir
 from PyQt6.QtGui import QIcon, QPalette, QColor
 
 # Add src to path for imports
@@ -50,10 +49,8 @@ def load_config() -> dict:
 
 def setup_app_style(app: QApplication, config: dict) -> None:
     """Configure application styling for macOS."""
-    # Enable high DPI scaling
-    app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-    
+    # Qt 6 always enables high-DPI scaling; the old attributes are gone
+
     # Set application properties
     app.setApplicationName(config.get('app', {}).get('name', 'CUEpoint'))
     app.setApplicationVersion(config.get('app', {}).get('version', '2.1.0'))
@@ -9,19 +9,27 @@ import time
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
-# Audio output libraries
+# Audio output libraries (sounddevice raises OSError, not ImportError,
+# when the PortAudio shared library itself is missing)
 try:
     import sounddevice as sd
     SOUNDDEVICE_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):
     SOUNDDEVICE_AVAILABLE = False
     logging.warning("sounddevice not available - audio playback disabled")
 
-from ..core.audio_loader import AudioData
+from core.audio_loader import AudioData
+
+
+@lru_cache(maxsize=1)
+def _query_devices():
+    """Cached PortAudio device enumeration - driver queries are slow."""
+    return sd.query_devices(), sd.default.device[1]
 
 
 class PlaybackState(Enum):
@@ -126,9 +134,8 @@ class AudioEngine(QObject):
         self.available_devices.clear()
         
         try:
-            devices = sd.query_devices()
-            default_device = sd.default.device[1]  # Output device
-            
+            devices, default_device = _query_devices()
+
             for i, device in enumerate(devices):
                 if device['max_output_channels'] > 0:  # Output device
                     audio_device = AudioDevice(
@@ -165,6 +172,11 @@ class AudioEngine(QObject):
     def get_available_devices(self) -> List[AudioDevice]:
         """Get list of available audio output devices."""
         return self.available_devices.copy()
+
+    def invalidate_device_cache(self) -> None:
+        """Clear the cached device enumeration and rescan (e.g. after hot-plug)."""
+        _query_devices.cache_clear()
+        self._scan_audio_devices()
     
     def set_audio_device(self, device_id: int) -> bool:
         """Set audio output device by ID."""
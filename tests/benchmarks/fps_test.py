@@ -13,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QTimer
 import numpy as np
 
 from gui.waveform_view import WaveformView
@@ -26,7 +26,6 @@ class FPSBenchmark:
     
     def __init__(self):
         self.app = QApplication(sys.argv)
-        self.app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
         
         # Test configuration
         self.config = {
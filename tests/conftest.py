@@ -2,23 +2,27 @@
 Pytest configuration and fixtures for CUEpoint tests
 """
 
+import sys
 import pytest
 import json
 import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
+# Source modules import each other by top-level package name (core, gui, ...)
+# so the src directory must be importable alongside the src.* test imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
 
 
 @pytest.fixture(scope="session")
 def qapp():
     """Create QApplication instance for GUI tests."""
+    # Qt 6 always enables high-DPI scaling; AA_EnableHighDpiScaling is gone
     app = QApplication.instance()
     if app is None:
         app = QApplication([])
-        app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
     yield app
     # Don't quit the app as it might be used by other tests
 
@@ -0,0 +1,66 @@
+"""
+Unit tests for Float32Pool buffer pool
+"""
+
+import numpy as np
+import pytest
+
+from src.core.buffer_pool import Float32Pool
+
+
+class TestFloat32Pool:
+    """Test cases for Float32Pool class."""
+
+    def test_acquire_returns_requested_shape(self):
+        """Test that acquired buffers match the requested shape and dtype."""
+        pool = Float32Pool()
+
+        buffer = pool.acquire((4, 8))
+        assert buffer.shape == (4, 8)
+        assert buffer.dtype == np.float32
+
+        # Integer shapes are accepted for 1D buffers
+        flat = pool.acquire(16)
+        assert flat.shape == (16,)
+
+    def test_release_and_reuse(self):
+        """Test that released buffers are reused on the next acquire."""
+        pool = Float32Pool()
+
+        first = pool.acquire((32,))
+        pool.release(first)
+        assert pool.pooled_bytes == first.nbytes
+
+        second = pool.acquire((32,))
+        assert second is first
+        assert pool.pooled_bytes == 0
+
+    def test_borrow_context_manager(self):
+        """Test that borrow releases the buffer after the block."""
+        pool = Float32Pool()
+
+        with pool.borrow((8, 8)) as buffer:
+            assert buffer.shape == (8, 8)
+            assert pool.pooled_bytes == 0
+
+        assert pool.pooled_bytes == buffer.nbytes
+
+    def test_max_bytes_bound(self):
+        """Test that releases past the byte budget are dropped."""
+        pool = Float32Pool(max_bytes=64)
+
+        small = pool.acquire((16,))  # 64 bytes
+        large = pool.acquire((32,))  # 128 bytes
+
+        pool.release(small)
+        assert pool.pooled_bytes == 64
+
+        pool.release(large)  # over budget - dropped
+        assert pool.pooled_bytes == 64
+
+    def test_release_rejects_wrong_dtype(self):
+        """Test that non-float32 buffers are rejected."""
+        pool = Float32Pool()
+
+        with pytest.raises(ValueError, match="float32"):
+            pool.release(np.zeros(4, dtype=np.float64))